@@ -3,10 +3,49 @@
 Add rounded corners to an icon for macOS style
 """
 
-from PIL import Image, ImageDraw
+from PIL import Image
 import sys
 import os
 
+try:
+    import numpy as np
+except ImportError:
+    print("❌ Python NumPy library not available")
+    print("   Install with: pip3 install numpy")
+    sys.exit(1)
+
+# Images with more pixels than this get their mask drawn at half resolution
+HALF_RES_MASK_PIXELS = 1024 * 1024
+
+def create_rounded_mask(width, height, radius):
+    """
+    Create an anti-aliased rounded rectangle mask
+
+    Args:
+        width: Mask width in pixels
+        height: Mask height in pixels
+        radius: Corner radius in pixels
+
+    Returns:
+        L-mode image, 255 inside the rounded rectangle and 0 outside
+    """
+    if radius <= 0:
+        return Image.new('L', (width, height), 255)
+
+    # Only the four radius x radius corner blocks are partially covered, so
+    # coverage is computed once for the top-left block and mirrored into
+    # the others; everything else stays fully opaque
+    offsets = radius - (np.arange(radius, dtype=np.float32) + 0.5)
+    distance = np.hypot(offsets[np.newaxis, :], offsets[:, np.newaxis])
+    corner = np.clip((radius - distance + 0.5) * 255, 0, 255).astype(np.uint8)
+
+    mask = np.full((height, width), 255, dtype=np.uint8)
+    mask[:radius, :radius] = corner
+    mask[:radius, width - radius:] = corner[:, ::-1]
+    mask[height - radius:, :radius] = corner[::-1, :]
+    mask[height - radius:, width - radius:] = corner[::-1, ::-1]
+    return Image.fromarray(mask)
+
 def add_rounded_corners(image_path, output_path, radius_percent=20):
     """
     Add rounded corners to an image
@@ -23,26 +62,22 @@ def add_rounded_corners(image_path, output_path, radius_percent=20):
     # Calculate radius based on percentage of smaller dimension
     radius = int(min(width, height) * radius_percent / 100)
 
-    # Create a mask for rounded corners
-    mask = Image.new('L', (width, height), 0)
-    draw = ImageDraw.Draw(mask)
-
-    # Draw rounded rectangle on mask
-    draw.rounded_rectangle(
-        [(0, 0), (width, height)],
-        radius=radius,
-        fill=255
-    )
+    # Nothing to round when the radius is 0: the image is written through
+    if radius > 0:
+        # Large masks are built at half resolution; the bilinear upscale
+        # back to full size keeps the anti-aliased edge
+        scale = 2 if width * height > HALF_RES_MASK_PIXELS else 1
 
-    # Create output image with transparent background
-    output = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    output.paste(img, (0, 0))
+        # Create a mask for rounded corners
+        mask = create_rounded_mask(width // scale, height // scale, radius // scale)
+        if scale > 1:
+            mask = mask.resize((width, height), Image.Resampling.BILINEAR)
 
-    # Apply the mask
-    output.putalpha(mask)
+        # Apply the mask as the image's alpha channel
+        img.putalpha(mask)
 
     # Save the result
-    output.save(output_path, 'PNG')
+    img.save(output_path, 'PNG')
     print(f"Created rounded corner image: {output_path}")
     print(f"  Size: {width}x{height}")
     print(f"  Corner radius: {radius}px ({radius_percent}% of {min(width, height)}px)")
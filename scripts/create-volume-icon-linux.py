@@ -6,6 +6,7 @@ This script works on Linux and can generate a placeholder icon for DMG packaging
 
 import os
 import sys
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -22,8 +23,8 @@ def check_dependencies():
 
     return has_imagemagick, has_pil
 
-def create_disk_icon_placeholder(output_path, size=512):
-    """Create a simple disk icon placeholder using PIL."""
+def create_disk_icon_placeholder(size=512):
+    """Create a simple disk icon placeholder image using PIL, or None on failure."""
     try:
         from PIL import Image, ImageDraw
 
@@ -78,62 +79,103 @@ def create_disk_icon_placeholder(output_path, size=512):
                 width=1
             )
 
-        img.save(output_path, 'PNG')
-        return True
+        return img
     except Exception as e:
         print(f"Error creating disk placeholder: {e}")
-        return False
+        return None
+
+def extract_icns_image(app_icon_path):
+    """Extract the app icon from an ICNS file Pillow can't decode, or None."""
+    from PIL import Image
+
+    # Try to extract PNG from icns using icns2png or ImageMagick
+    png_path = '/tmp/app_icon.png'
+
+    # Try different methods to extract PNG from ICNS
+    if subprocess.run(['which', 'icns2png'], capture_output=True).returncode == 0:
+        subprocess.run(['icns2png', '-x', app_icon_path], cwd='/tmp')
+        # Find the largest extracted PNG (named <icns stem>_<W>x<H>x<depth>.png)
+        # from a single directory scan; scandir entries carry their stat info
+        prefix = f'{Path(app_icon_path).stem}_'
+        with os.scandir('/tmp') as entries:
+            pngs = [entry for entry in entries
+                    if entry.name.startswith(prefix) and entry.name.endswith('.png')]
+        best = (next((png for png in pngs if '_512x512' in png.name), None)
+                or next((png for png in pngs if '_256x256' in png.name), None)
+                or max(pngs, key=lambda png: png.stat().st_size, default=None))
+        if best:
+            return Image.open(best.path).convert('RGBA')
+        print(f"Could not extract PNG from {app_icon_path}")
+        return None
+
+    # Fallback: use ImageMagick to extract first image
+    result = subprocess.run(
+        ['convert', f'{app_icon_path}[0]', png_path],
+        capture_output=True
+    )
+    if result.returncode == 0:
+        return Image.open(png_path).convert('RGBA')
+
+    print(f"Could not convert {app_icon_path} to PNG")
+    # Try to use the PNG version if it exists
+    png_alt = app_icon_path.replace('.icns', '.png')
+    if Path(png_alt).exists():
+        return Image.open(png_alt).convert('RGBA')
+    return None
+
+def optimize_pngs(png_paths):
+    """Losslessly recompress PNGs with oxipng, if it is installed."""
+    if not shutil.which('oxipng'):
+        return
+    subprocess.run(
+        ['oxipng', '-o', '2', '--strip', 'safe', '-t', str(os.cpu_count() or 1),
+         *[str(path) for path in png_paths]],
+        capture_output=True
+    )
+
+def save_iconset_level(level):
+    """Save one iconset image, linking its other file names to the same PNG."""
+    img, paths = level
+    first_path, *other_paths = paths
+
+    # Iconset PNGs are only packed into an .icns, so favour encode speed
+    # over size; the user-facing VolumeIcon.png keeps the default level
+    img.save(first_path, 'PNG', compress_level=1)
+
+    # Same pixel size means same file: encode once, hard link the rest
+    for path in other_paths:
+        if os.path.lexists(path):
+            os.remove(path)
+        try:
+            os.link(first_path, path)
+        except OSError:
+            shutil.copy(first_path, path)
 
 def create_composite_icon(app_icon_path, output_path):
     """Create composite icon with app icon overlaid on disk icon."""
     try:
         from PIL import Image
 
-        # Create or load disk icon
-        disk_icon_path = '/tmp/disk_icon.png'
-        if not create_disk_icon_placeholder(disk_icon_path, 512):
+        # Create the disk icon in memory
+        disk_img = create_disk_icon_placeholder(512)
+        if disk_img is None:
             print("Failed to create disk icon")
             return False
-
-        # Load the disk icon
-        disk_img = Image.open(disk_icon_path).convert('RGBA')
         base_size = disk_img.size[0]
 
         # Load and resize app icon
         if Path(app_icon_path).suffix.lower() == '.png':
             app_img = Image.open(app_icon_path).convert('RGBA')
         elif Path(app_icon_path).suffix.lower() == '.icns':
-            # Try to extract PNG from icns using iconutil (macOS) or icns2png
-            png_path = '/tmp/app_icon.png'
-
-            # Try different methods to extract PNG from ICNS
-            if subprocess.run(['which', 'icns2png'], capture_output=True).returncode == 0:
-                subprocess.run(['icns2png', '-x', app_icon_path], cwd='/tmp')
-                # Find the largest extracted PNG
-                pngs = list(Path('/tmp').glob('*_512x512*.png'))
-                if not pngs:
-                    pngs = list(Path('/tmp').glob('*_256x256*.png'))
-                if pngs:
-                    app_img = Image.open(pngs[0]).convert('RGBA')
-                else:
-                    print(f"Could not extract PNG from {app_icon_path}")
-                    return False
-            else:
-                # Fallback: use ImageMagick to extract first image
-                result = subprocess.run(
-                    ['convert', f'{app_icon_path}[0]', png_path],
-                    capture_output=True
-                )
-                if result.returncode == 0:
-                    app_img = Image.open(png_path).convert('RGBA')
-                else:
-                    print(f"Could not convert {app_icon_path} to PNG")
-                    # Try to use the PNG version if it exists
-                    png_alt = app_icon_path.replace('.icns', '.png')
-                    if Path(png_alt).exists():
-                        app_img = Image.open(png_alt).convert('RGBA')
-                    else:
-                        return False
+            try:
+                # Pillow decodes most ICNS files itself (largest image first)
+                app_img = Image.open(app_icon_path).convert('RGBA')
+            except (OSError, ValueError, SyntaxError):
+                # Pillow decodes lazily; its ICNS plugin raises SyntaxError
+                # from convert() on entries it can't read
+                app_img = extract_icns_image(app_icon_path)
+            if app_img is None:
+                return False
         else:
             print(f"Unsupported icon format: {app_icon_path}")
             return False
@@ -146,8 +188,8 @@ def create_composite_icon(app_icon_path, output_path):
         x = (base_size - overlay_size) // 2
         y = (base_size - overlay_size) // 2
 
-        # Composite the images
-        disk_img.paste(app_img, (x, y), app_img)
+        # Composite the images (RGBA "over" blend of the app icon's box only)
+        disk_img.alpha_composite(app_img, (x, y))
 
         # Save as PNG
         disk_img.save(output_path, 'PNG')
@@ -157,23 +199,36 @@ def create_composite_icon(app_icon_path, output_path):
         iconset_dir = Path(output_path).parent / 'VolumeIcon.iconset'
         iconset_dir.mkdir(exist_ok=True)
 
-        for size in sizes:
-            resized = disk_img.resize((size, size), Image.Resampling.LANCZOS)
-            resized.save(iconset_dir / f'icon_{size}x{size}.png', 'PNG')
-
-            # Also create @2x versions for retina
-            if size <= 256:
-                size2x = size * 2
-                resized2x = disk_img.resize((size2x, size2x), Image.Resampling.LANCZOS)
-                resized2x.save(iconset_dir / f'icon_{size}x{size}@2x.png', 'PNG')
+        # Walk down the sizes, halving the previous level each time instead of
+        # resampling every size from the full source image
+        levels = []
+        current = disk_img
+        iconset_dir_str = str(iconset_dir)
+        for size in sorted(sizes, reverse=True):
+            if current.width != size:
+                # Each size is exactly half the previous one: integer 2x2 box
+                # average, no resampling kernel
+                current = current.reduce(2)
+            paths = [os.path.join(iconset_dir_str, f'icon_{size}x{size}.png')]
+
+            # This level is also the @2x (retina) version of the next size down
+            half = size // 2
+            if half in sizes:
+                paths.append(os.path.join(iconset_dir_str, f'icon_{half}x{half}@2x.png'))
+            levels.append((current, paths))
+
+        # The levels are small enough that a worker pool costs more to start
+        # than the encodes it would spread out
+        for level in levels:
+            save_iconset_level(level)
+
+        # Squeeze the fast-encoded PNGs with a parallel out-of-band pass; the
+        # hard-linked names share a file, so each level is passed only once
+        optimize_pngs([output_path, *(paths[0] for _, paths in levels)])
 
         print(f"✅ Created composite icon: {output_path}")
         print(f"✅ Created iconset in: {iconset_dir}")
 
-        # Clean up temp files
-        if Path(disk_icon_path).exists():
-            os.remove(disk_icon_path)
-
         return True
 
     except Exception as e:
@@ -191,6 +246,8 @@ def main():
     if not has_pil:
         print("❌ Python PIL/Pillow is required but not installed")
         print("   Install with: pip install Pillow")
+        print("   (or, for faster resampling, the drop-in Pillow-SIMD fork:")
+        print('    CC="cc -mavx2" pip install --no-binary :all: --force-reinstall pillow-simd)')
         sys.exit(1)
 
     # Set up paths
@@ -225,7 +282,6 @@ def main():
 
     if create_composite_icon(str(app_icon), str(output_path)):
         # Also create hidden version
-        import shutil
         hidden_path = output_dir / '.VolumeIcon.png'
         shutil.copy(output_path, hidden_path)
 